@@ -2,107 +2,523 @@ import sys
 import os
 import subprocess
 import threading
+import time
+import functools
+import math
+import hashlib
+import shutil
+from fractions import Fraction
+from bisect import bisect_left
+from collections import OrderedDict, deque
+from itertools import chain, tee
+try:
+    from itertools import pairwise
+except ImportError: # Python < 3.10
+    def pairwise(iterable):
+        a, b = tee(iterable)
+        next(b, None)
+        return zip(a, b)
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
                              QWidget, QPushButton, QLabel, QSlider, QListWidget, 
                              QFileDialog, QMessageBox, QProgressBar, QSpinBox,
                              QGroupBox, QGridLayout, QCheckBox, QListWidgetItem, QTabWidget, QSizePolicy)
-from PyQt5.QtCore import Qt, QTimer, QThread, pyqtSignal, QEvent
-from PyQt5.QtGui import QPixmap, QFont
+from PyQt5.QtCore import Qt, QTimer, QThread, QThreadPool, QRunnable, pyqtSignal, QEvent, QObject
+from PyQt5.QtGui import QPixmap, QFont, QImage
 import tempfile
 import json
 import re
 
+try:
+    import av
+except ImportError:
+    av = None # PyAV is optional, previews fall back to spawning ffmpeg per frame
+
+try:
+    import numpy as np
+except ImportError:
+    np = None # NumPy is optional, auto-split falls back to a plain Python loop
+
+try:
+    from scenedetect import open_video, SceneManager
+    from scenedetect.detectors import ContentDetector
+except ImportError:
+    SceneManager = None # PySceneDetect is optional, scene detection falls back to ffmpeg's select filter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None # orjson is optional, project files fall back to the json module
+
+# Keep ffmpeg/ffprobe from flashing a console window on Windows (the flag only exists there)
+_NO_WINDOW = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+# ffmpeg logs this line each time the segment muxer starts a new output file
+_SEGMENT_OPEN_RE = re.compile(r"Opening '.*' for writing")
+# Scene detections are sent to the GUI thread in batches of this many, or at least this often (seconds)
+_SCENE_BATCH_SIZE = 16
+_SCENE_BATCH_INTERVAL = 0.2
+
+# Timestamp of a frame in ffmpeg's metadata=print output, e.g. "frame:3    pts:11264   pts_time:0.44"
+_PTS_TIME_RE = re.compile(rb'pts_time:(-?\d+(?:\.\d*)?)')
+# The select filter's score for the same frame, printed on the following line
+_SCENE_SCORE_RE = re.compile(rb'lavfi\.scene_score=(\d+(?:\.\d*)?)')
+
+_SCENE_STATS_HEADER = "Frame Number,Time,Scene Score\n"
+
+def _write_scene_stats(stats_path, rows):
+    # One "frame,time,score" row per decoded frame, written atomically like the probe cache
+    fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=os.path.dirname(stats_path))
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(_SCENE_STATS_HEADER)
+            f.writelines(f"{i},{t},{score}\n" for i, (t, score) in enumerate(rows))
+        os.replace(tmp_path, stats_path)
+    except OSError:
+        os.remove(tmp_path)
+        raise
+
+def _read_scene_stats(stats_path):
+    # Returns the (time, score) rows, or None when there is no usable cache
+    try:
+        with open(stats_path, 'r') as f:
+            if f.readline() != _SCENE_STATS_HEADER:
+                return None
+            rows = []
+            for line in f:
+                _, t, score = line.split(',')
+                rows.append((float(t), float(score)))
+            return rows
+    except (OSError, ValueError):
+        return None
+
+_THUMB_CACHE_SIZE = 256 # Preview frames kept in memory per video
+
+_SNAP_TOLERANCE_MS = 500 # Splits only snap to a detected scene cut this close to them
+
+def _nearest_sorted(values, t):
+    # Closest entry of a sorted list to t, or None if the list is empty
+    idx = bisect_left(values, t)
+    if idx == 0:
+        return values[0] if values else None
+    if idx == len(values):
+        return values[-1]
+    before, after = values[idx - 1], values[idx]
+    return before if t - before <= after - t else after
+
+_PROBE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "py-videosplitter")
+
+def _file_cache_key(file_path):
+    # Key on size and mtime as well as the path so results for an edited file are never reused
+    file_path = os.path.abspath(file_path)
+    st = os.stat(file_path)
+    return hashlib.blake2b(f"{file_path}|{st.st_size}|{st.st_mtime_ns}".encode()).hexdigest()
+
+@functools.lru_cache(maxsize=128)
+def _probe_cached(key, file_path):
+    cache_path = os.path.join(_PROBE_CACHE_DIR, f"{key}.json")
+    try:
+        with open(cache_path, 'r') as f:
+            video_info = json.load(f)
+        if 'streams' in video_info:
+            return video_info
+    except (OSError, ValueError):
+        pass # Not cached yet (or unreadable), fall through to ffprobe
+
+    cmd = [
+        'ffprobe', '-v', 'error', '-print_format', 'json',
+        '-show_format', '-show_streams', file_path
+    ]
+    result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, creationflags=_NO_WINDOW)
+    video_info = json.loads(result.stdout or b'{}')
+    # Raising keeps a failed probe (half-copied file, transient I/O error) out of both caches
+    if result.returncode != 0 or 'streams' not in video_info:
+        raise RuntimeError(result.stderr.decode('utf-8', 'replace').strip() or "ffprobe could not read the file")
+
+    # Write to a temp file first so a crash never leaves a truncated cache entry behind
+    try:
+        os.makedirs(_PROBE_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=_PROBE_CACHE_DIR)
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(video_info, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            os.remove(tmp_path)
+            raise
+    except OSError:
+        pass # The cache is best effort only
+
+    return video_info
+
+@functools.lru_cache(maxsize=1)
+def _detect_hwaccels():
+    # Ask ffmpeg once which hardware decoders it was built with (cuda, qsv, d3d11va, videotoolbox, ...)
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-hwaccels'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, creationflags=_NO_WINDOW)
+    except OSError:
+        return ()
+    lines = result.stdout.splitlines()
+    return tuple(line.strip() for line in lines[1:] if line.strip())
+
+_hwaccel_failed = False
+
+def _hwaccel_args():
+    # Decoder options to prepend before '-i'; empty once hardware decode has been seen to fail
+    if _hwaccel_failed or not _detect_hwaccels():
+        return []
+    return ['-hwaccel', 'auto']
+
+def _disable_hwaccel():
+    global _hwaccel_failed
+    _hwaccel_failed = True
+
+# Video encoder options for re-encoded exports, hardware encoders first in order of preference
+_VIDEO_ENCODERS = {
+    'nvenc': ['-c:v', 'h264_nvenc', '-preset', 'p4', '-rc', 'vbr', '-cq', '23', '-b:v', '0'],
+    'qsv': ['-c:v', 'h264_qsv', '-preset', 'faster', '-global_quality', '23'],
+    'videotoolbox': ['-c:v', 'h264_videotoolbox', '-q:v', '65'],
+    'x264': ['-c:v', 'libx264', '-preset', 'veryfast', '-crf', '20', '-threads', '0'],
+}
+_AUDIO_ENCODER = ['-c:a', 'aac', '-b:a', '192k']
+
+@functools.lru_cache(maxsize=1)
+def _detect_encoders():
+    # Ask ffmpeg once which encoders it was built with
+    try:
+        result = subprocess.run(['ffmpeg', '-hide_banner', '-encoders'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, creationflags=_NO_WINDOW)
+    except OSError:
+        return frozenset()
+    # Example line: " V....D h264_nvenc           NVIDIA NVENC H.264 encoder (codec h264)"
+    return frozenset(line.split()[1] for line in result.stdout.splitlines() if len(line.split()) > 1)
+
+_failed_encoders = set()
+_failed_encoders_lock = threading.Lock() # Export jobs run concurrently and may report failures at the same time
+
+def _pick_encoder():
+    # Best available encoder for re-encoded exports; libx264 is the software fallback
+    available = _detect_encoders()
+    with _failed_encoders_lock:
+        failed = set(_failed_encoders)
+    for codec, args in _VIDEO_ENCODERS.items():
+        if codec != 'x264' and codec not in failed and args[1] in available:
+            return codec
+    return 'x264'
+
 class VideoProcessor(QThread):
     progress = pyqtSignal(int)
     finished = pyqtSignal(str)
     error = pyqtSignal(str)
     
-    def __init__(self, video_path, splits, output_dir):
+    def __init__(self, video_path, splits, output_dir, codec='copy'):
         super().__init__()
         self.video_path = video_path
         self.splits = splits
         self.output_dir = output_dir
+        self.codec = codec # 'copy' for keyframe cuts, otherwise a key of _VIDEO_ENCODERS for frame-accurate cuts
+        self._codec_lock = threading.Lock() # self.codec is switched to x264 by whichever job first sees the hardware encoder fail
     
+    def _run_segment(self, index, start, end, codec=None):
+        if codec is None:
+            with self._codec_lock:
+                codec = self.codec
+        base_name = os.path.splitext(os.path.basename(self.video_path))[0]
+        output_path = os.path.join(self.output_dir, f"{base_name}_part_{index+1:03d}.mp4")
+        duration = end - start
+
+        if codec == 'copy':
+            cmd = [
+                'ffmpeg', '-y', '-i', self.video_path,
+                '-ss', str(start), '-t', str(duration),
+                '-c', 'copy', output_path
+            ]
+        else:
+            # Seeking before -i is exact when re-encoding, and avoids decoding everything up to the start
+            cmd = [
+                'ffmpeg', '-y', '-ss', str(start), '-i', self.video_path, '-t', str(duration)
+            ] + _VIDEO_ENCODERS[codec] + _AUDIO_ENCODER + [output_path]
+
+        # Only stderr is ever looked at (on failure), so don't pipe or decode stdout
+        process = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, creationflags=_NO_WINDOW)
+
+        if process.returncode != 0 and codec not in ('copy', 'x264'):
+            # ffmpeg may list a hardware encoder without a usable device behind it, finish in software instead.
+            # The retry is based on the codec this job used, so a job that started before the switch retries too.
+            with _failed_encoders_lock:
+                _failed_encoders.add(codec)
+            with self._codec_lock:
+                self.codec = 'x264'
+            return self._run_segment(index, start, end, 'x264')
+        return index, process.returncode, process.stderr
+
+    def _is_contiguous(self):
+        # The segment muxer can only cut the whole input at a list of boundaries
+        if not self.splits or self.splits[0][0] != 0:
+            return False
+        return all(end == next_start for (_, end), (next_start, _) in zip(self.splits, self.splits[1:]))
+
+    def _run_single_pass(self):
+        base_name = os.path.splitext(os.path.basename(self.video_path))[0]
+        # The muxer expands %-sequences anywhere in the pattern, so escape the directory as well as the name
+        output_pattern = os.path.join(self.output_dir, base_name).replace('%', '%%') + "_part_%03d.mp4"
+        segment_times = ",".join(str(start) for start, _ in self.splits[1:])
+        total = len(self.splits)
+
+        cmd = ['ffmpeg', '-y', '-nostats', '-i', self.video_path, '-c', 'copy', '-f', 'segment']
+        if segment_times:
+            cmd += ['-segment_times', segment_times]
+        cmd += ['-segment_start_number', '1', '-reset_timestamps', '1', output_pattern]
+
+        process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, creationflags=_NO_WINDOW)
+
+        # Each new output file means the previous segment is complete
+        opened = 0
+        log_tail = deque(maxlen=20)
+        for line in iter(process.stderr.readline, ''):
+            if _SEGMENT_OPEN_RE.search(line):
+                if opened:
+                    self.progress.emit(int(opened / total * 100))
+                opened += 1
+            log_tail.append(line)
+
+        process.stderr.close()
+        process.wait()
+
+        if process.returncode != 0:
+            self.error.emit(f"Error processing segments: {''.join(log_tail)}")
+            return
+
+        self.progress.emit(100)
+        self.finished.emit(f"Successfully created {opened} video segments")
+
+    def _run_per_segment(self):
+        total = len(self.splits)
+        # Each job is an independent ffmpeg process, so threads are enough. Stream copies are I/O-bound and
+        # scale with cores; encoders already use several threads (or a limited number of hardware sessions).
+        max_workers = min(total, os.cpu_count() or 4) if self.codec == 'copy' else min(total, 2)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self._run_segment, i, start, end)
+                       for i, (start, end) in enumerate(self.splits)]
+
+            done = 0
+            for future in as_completed(futures):
+                i, returncode, stderr = future.result()
+                if returncode != 0:
+                    for pending in futures:
+                        pending.cancel()
+                    self.error.emit(f"Error processing segment {i+1}: {stderr.decode('utf-8', 'replace')}")
+                    return
+
+                done += 1
+                self.progress.emit(int(done / total * 100))
+
+        self.finished.emit(f"Successfully created {total} video segments")
+
     def run(self):
         try:
-            base_name = os.path.splitext(os.path.basename(self.video_path))[0]
-            
-            for i, (start, end) in enumerate(self.splits):
-                output_path = os.path.join(self.output_dir, f"{base_name}_part_{i+1:03d}.mp4")
-                duration = end - start
-                
-                cmd = [
-                    'ffmpeg', '-y', '-i', self.video_path,
-                    '-ss', str(start), '-t', str(duration),
-                    '-c', 'copy', output_path
-                ]
-                
-                process = subprocess.run(cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
-                if process.returncode != 0:
-                    self.error.emit(f"Error processing segment {i+1}: {process.stderr}")
-                    return
-                
-                progress = int((i + 1) / len(self.splits) * 100)
-                self.progress.emit(progress)
-            
-            self.finished.emit(f"Successfully created {len(self.splits)} video segments")
+            # One ffmpeg process reading the input once is much cheaper than one process per segment
+            if self.codec == 'copy' and self._is_contiguous():
+                self._run_single_pass()
+            else:
+                self._run_per_segment()
         except Exception as e:
             self.error.emit(f"Processing error: {str(e)}")
 
-class SceneDetector(QThread):
-    scene_detected = pyqtSignal(float)
+class SceneDetectorSignals(QObject):
+    # A QRunnable is not a QObject, so the detector's signals live here
+    scenes_detected = pyqtSignal(list) # Batches of scene times, to keep cross-thread signal traffic down
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self, video_path, threshold):
+class SceneDetector(QRunnable):
+    # Runs on QThreadPool.globalInstance(); cancel() stops it cooperatively instead of killing the thread
+    def __init__(self, video_path, threshold, stats_path=None):
         super().__init__()
+        self.signals = SceneDetectorSignals()
         self.video_path = video_path
         self.threshold = threshold
+        # Per-frame scene scores from an earlier ffmpeg pass, so trying another threshold needs no decoding
+        self.stats_path = stats_path
+        self._pending = []
+        self._last_flush = time.monotonic()
+        self._cancel = threading.Event()
+        self._process = None
+        self._scene_manager = None
+
+    def cancel(self):
+        # Called from the GUI thread; also interrupts whatever is blocking the worker
+        self._cancel.set()
+        process = self._process
+        if process is not None and process.poll() is None:
+            process.kill()
+        if self._scene_manager is not None:
+            self._scene_manager.stop()
+
+    def _queue_scene(self, scene_time):
+        self._pending.append(scene_time)
+        if len(self._pending) >= _SCENE_BATCH_SIZE:
+            self._flush_scenes()
+        else:
+            self._flush_if_due()
+
+    def _flush_if_due(self):
+        # Called for every analyzed frame (or chunk of frames), so a lone cut is not held back until the next one
+        if self._pending and time.monotonic() - self._last_flush >= _SCENE_BATCH_INTERVAL:
+            self._flush_scenes()
+
+    def _flush_scenes(self):
+        if self._pending and not self._cancel.is_set():
+            self.signals.scenes_detected.emit(self._pending)
+        self._pending = []
+        self._last_flush = time.monotonic()
+
+    def _detect_with_scenedetect(self):
+        # PySceneDetect's content detector works on downscaled frames and compares them in HSV space
+        video = open_video(self.video_path, backend='pyav' if av is not None else 'opencv')
+        scene_manager = SceneManager()
+        # ffmpeg's scene score is 0-1, the content detector's threshold is on a 0-255 scale (default 27)
+        scene_manager.add_detector(ContentDetector(threshold=self.threshold * 100))
+
+        def on_scene_cut(image, position):
+            # Newer releases pass a FrameTimecode (get_seconds() is deprecated in favour of .seconds), older ones the frame number
+            if hasattr(position, 'seconds'):
+                self._queue_scene(float(position.seconds))
+            elif hasattr(position, 'get_seconds'):
+                self._queue_scene(position.get_seconds())
+            else:
+                self._queue_scene(position / video.frame_rate)
+
+        self._scene_manager = scene_manager
+        # The callback only runs on cuts, so analyze about a second of video per call to get a chance to flush
+        chunk_frames = max(1, round(video.frame_rate))
+        while not self._cancel.is_set():
+            if scene_manager.detect_scenes(video, duration=chunk_frames, show_progress=False, callback=on_scene_cut) == 0:
+                break # End of the video
+            self._flush_if_due()
+        self._flush_scenes()
+
+    def _replay_stats(self, rows):
+        for scene_time, score in rows:
+            if self._cancel.is_set():
+                return
+            if score > self.threshold:
+                self._queue_scene(scene_time)
+            else:
+                self._flush_if_due()
+        self._flush_scenes()
+
+    def _detect(self, hwaccel_args):
+        # Use the scene score from ffmpeg's select filter; metadata=print writes a pts_time line and a score line per frame to stdout.
+        # Every frame is selected, both so the scores can be cached and so a line arrives per frame to time batch flushes by.
+        # Scoring on a grayscale frame is enough to spot cuts and moves a third of the data.
+        cmd = ['ffmpeg', '-v', 'error', '-nostats'] + hwaccel_args + [
+            '-threads', '0', '-i', self.video_path, '-an', '-sn',
+            '-vf', "format=gray,select='gte(scene,0)',metadata=print:key=lavfi.scene_score:file=-",
+            '-f', 'null', '-'
+        ]
+        
+        process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=1 << 16, creationflags=_NO_WINDOW)
+        self._process = process
+        if self._cancel.is_set():
+            process.kill() # cancel() ran before the process was visible to it
+
+        # Drain stderr while stdout is being read. Decoder errors on a damaged file can fill the pipe,
+        # and ffmpeg would then block writing them while we block waiting for stdout.
+        log_tail = deque(maxlen=20)
+        stderr_reader = threading.Thread(target=lambda: log_tail.extend(iter(process.stderr.readline, b'')), daemon=True)
+        stderr_reader.start()
+        
+        rows = []
+        frame_time = None
+        for line in iter(process.stdout.readline, b''):
+            match = _PTS_TIME_RE.search(line)
+            if match:
+                frame_time = float(match.group(1))
+                continue
+            match = _SCENE_SCORE_RE.search(line)
+            if match and frame_time is not None:
+                score = float(match.group(1))
+                rows.append((frame_time, score))
+                if score > self.threshold:
+                    self._queue_scene(frame_time)
+                else:
+                    self._flush_if_due()
+        self._flush_scenes()
+
+        process.stdout.close()
+        stderr_reader.join()
+        process.stderr.close()
+        process.wait()
+        error_output = b''.join(log_tail).decode('utf-8', 'replace')
+        self._process = None
+
+        if process.returncode == 0 and self.stats_path:
+            try:
+                _write_scene_stats(self.stats_path, rows)
+            except OSError:
+                pass # The cache is best effort only
+        return process.returncode, error_output
+
+    def _finish(self):
+        if not self._cancel.is_set():
+            self.signals.finished.emit()
 
     def run(self):
         try:
-            # Use the scenedetect filter from ffmpeg. Scene change detected when average difference between frames exceeds threshold.
-            cmd = [
-                'ffmpeg', '-i', self.video_path,
-                '-filter:v', f"select='gt(scene,{self.threshold})',showinfo",
-                '-f', 'null', '-'
-            ]
-            
-            process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
-            
-            # Read stderr line by line to get progress and scene detections
-            for line in iter(process.stderr.readline, ''):
-                if "Parsed_showinfo_" in line:
-                    # Example line: [Parsed_showinfo_0 @ 0000021319717540] n:  126 pts:    5292 pos:  1605333 bytes t:0.046927 s
-                    # This line format is from the showinfo filter, not scene change detection
-                    pass # We are interested in lines from scene detect filter
-                elif "scene_change_score" in line:
-                    # Example line from scenedetect: [Parsed_select_0 @ 0x...] n:126 pts:5292 t:0.046927 scene_change_score: 0.123456
-                    # Look for lines that indicate scene changes based on the score.
-                    # ffmpeg's scenedetect filter will output a 'scene_score' if a scene change is detected.
-                    # The exact output format can vary, but typically it would be a line like this:
-                    # [Parsed_select_0 @ 0x...] n:126 pts:5292 t:0.046927 scene_change_score: 0.123456
-
-                    # Extract time from line
-                    try:
-                        # Use regex to find the time 't:X.XXX'
-                        match = re.search(r't:([\d.]+)', line)
-                        if match:
-                            scene_time = float(match.group(1))
-                            self.scene_detected.emit(scene_time)
-                    except ValueError:
-                        continue # Skip if time cannot be parsed
-
-            process.stderr.close()
-            process.wait()
-
-            if process.returncode != 0:
-                self.error.emit(f"Scene detection error: {process.stderr.read()}")
+            rows = _read_scene_stats(self.stats_path) if self.stats_path else None
+            if rows is not None:
+                self._replay_stats(rows)
+                self._finish()
                 return
 
-            self.finished.emit()
+            if SceneManager is not None:
+                try:
+                    self._detect_with_scenedetect()
+                    self._finish()
+                    return
+                except Exception:
+                    if self._cancel.is_set():
+                        return
+                    self._pending = [] # Could not open or decode the video, use ffmpeg's select filter instead
+
+            hwaccel_args = _hwaccel_args()
+            returncode, log = self._detect(hwaccel_args)
+            if returncode != 0 and hwaccel_args and not self._cancel.is_set():
+                # The hardware decoder could not handle this input, retry in software
+                _disable_hwaccel()
+                returncode, log = self._detect([])
+
+            if self._cancel.is_set():
+                return # ffmpeg was killed on purpose, that is not an error
+            if returncode != 0:
+                self.signals.error.emit(f"Scene detection error: {log}")
+                return
+
+            self.signals.finished.emit()
         except Exception as e:
-            self.error.emit(f"Scene detection process error: {str(e)}")
+            if not self._cancel.is_set():
+                self.signals.error.emit(f"Scene detection process error: {str(e)}")
+
+class DelayedNotification(QObject):
+    # Rate-limits a slot: values passed to notify() are coalesced and only the latest one is
+    # delivered, at most once per interval (16 ms ~ one frame at 60 Hz)
+    def __init__(self, callback, interval=16, parent=None):
+        super().__init__(parent)
+        self.callback = callback
+        self._value = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._deliver)
+
+    def notify(self, value):
+        self._value = value
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _deliver(self):
+        self.callback(self._value)
 
 class AspectRatioWidget(QWidget):
     def __init__(self, content_widget, aspect_ratio=16/9, parent=None):
@@ -135,17 +551,158 @@ class AspectRatioWidget(QWidget):
         if self.aspect_ratio == 0: return self.content_widget.width()
         return int(height * self.aspect_ratio)
 
+# Dark mode stylesheet, shared by every window
+_DARK_QSS = """
+    QWidget {
+        background-color: #2b2b2b; /* Dark background */
+        color: #ffffff; /* White text */
+        font-family: "Segoe UI", sans-serif;
+    }
+    QMainWindow {
+        background-color: #2b2b2b;
+    }
+    QGroupBox {
+        background-color: #3c3c3c; /* Slightly lighter dark for groups */
+        border: 1px solid #5a5a5a;
+        border-radius: 5px;
+        margin-top: 1ex; /* Give space for the title */
+        font-size: 10pt;
+        font-weight: bold;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top center; /* Position at top center */
+        padding: 0 3px;
+        background-color: #3c3c3c;
+        color: #87ceeb; /* Sky Blue for titles */
+    }
+    QLabel {
+        color: #ffffff;
+    }
+    QPushButton {
+        background-color: #4682b4; /* Steel Blue */
+        color: #ffffff;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 5px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #5b9bd5; /* Lighter Steel Blue on hover */
+    }
+    QPushButton:pressed {
+        background-color: #3a6d9b; /* Darker Steel Blue on pressed */
+    }
+    QPushButton:disabled {
+        background-color: #5a5a5a;
+        color: #cccccc;
+    }
+    QSlider::groove:horizontal {
+        border: 1px solid #5a5a5a;
+        height: 8px; /* the groove height */
+        background: #3c3c3c;
+        margin: 2px 0;
+        border-radius: 4px;
+    }
+    QSlider::handle:horizontal {
+        background: #87ceeb; /* Sky Blue handle */
+        border: 1px solid #87ceeb;
+        width: 18px;
+        margin: -5px 0; /* handle is 18x18 when groove is 8px */
+        border-radius: 9px;
+    }
+    QSlider::sub-page:horizontal {
+        background: #4682b4; /* Steel Blue for filled part */
+        border: 1px solid #4682b4;
+        height: 8px;
+        border-radius: 4px;
+    }
+    QListWidget {
+        background-color: #3c3c3c;
+        border: 1px solid #5a5a5a;
+        border-radius: 5px;
+        color: #ffffff;
+        alternate-background-color: #444444;
+    }
+    QListWidget::item {
+        padding: 5px;
+    }
+    QListWidget::item:selected {
+        background-color: #4682b4; /* Steel Blue for selected item */
+        color: #ffffff;
+    }
+    QProgressBar {
+        border: 1px solid #5a5a5a;
+        border-radius: 5px;
+        text-align: center;
+        background-color: #3c3c3c;
+        color: #ffffff;
+    }
+    QProgressBar::chunk {
+        background-color: #4682b4; /* Steel Blue for progress */
+        width: 20px;
+    }
+    QCheckBox::indicator {
+        width: 16px;
+        height: 16px;
+    }
+    QCheckBox::indicator:unchecked {
+        background-color: #5a5a5a;
+        border: 1px solid #888888;
+        border-radius: 3px;
+    }
+    QCheckBox::indicator:checked {
+        background-color: #4682b4; /* Steel Blue for checked */
+        border: 1px solid #4682b4;
+        border-radius: 3px;
+        image: url(data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAcAAAAHCAYAAACzXPxXAAAAAXNSR0IArs4c6QAAADFJREFUGFcBwAEGAACjKx5OAAAAAElFTkSuQmCC); /* A tiny white checkmark if you have one */
+    }
+    QTabWidget::pane {
+        border: 1px solid #5a5a5a;
+        background-color: #3c3c3c;
+        border-radius: 5px;
+    }
+    QTabBar::tab {
+        background: #3c3c3c;
+        border: 1px solid #5a5a5a;
+        border-bottom-color: #3c3c3c; /* same as pane color */
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+        min-width: 8ex;
+        padding: 5px;
+        color: #ffffff;
+    }
+    QTabBar::tab:selected {
+        background: #4682b4; /* Steel Blue for selected tab */
+        border-color: #4682b4;
+        border-bottom-color: #4682b4; /* selected tab has same border color as pane */
+    }
+    QTabBar::tab:hover {
+        background: #5b9bd5; /* Lighter Steel Blue on hover */
+    }
+"""
+
 class VideoSplitter(QMainWindow):
     def __init__(self):
         super().__init__()
         self.video_path = None
-        self.video_duration = 0.0
-        self.current_time = 0.0
-        self.splits = []
+        # Times are kept as integer milliseconds (the timeline slider's unit) and only turned into seconds for ffmpeg
+        self.video_duration_ms = 0
+        self.current_time_ms = 0
+        self._duration_str = self.format_time_ms(0)
+        self.splits = [] # Sorted split points in milliseconds
+        self._splits_set = set() # Same points as self.splits, for O(1) duplicate checks
+        self._list_row_widgets = [] # Row widget shown in splits_list for each entry of self.splits
         self.temp_dir = tempfile.mkdtemp()
         self.fps = 30  # Default FPS
+        self._frame_dt_ms = 1000.0 / self.fps # Frame duration, recomputed whenever fps changes
         self.video_width = 0 # Initialize video width
         self.video_height = 0 # Initialize video height
+        self.video_container = None # Persistent PyAV decoder for previews, if available
+        self.video_stream = None
+        self._thumb_cache = OrderedDict() # (frame index, accurate) -> QPixmap, least recently used first
+        self._pending_seek = None # Latest slider position waiting to be shown
+        self._preview_width = None # Preview size in device pixels, frames are scaled down to it when decoded
         
         # New attributes for auto-split
         self.auto_split_enabled = False
@@ -154,7 +711,23 @@ class VideoSplitter(QMainWindow):
         
         # New attributes for scene detection
         self.scene_detection_threshold = 0.4 # Default scene detection threshold
-        self.scene_detector = None # To hold the scene detection thread
+        self.scene_detector = None # The scene detection task running on the thread pool
+        self._warn_box = None # Created on first use by _show_warning and reused afterwards
+        self._scene_cuts = [] # Sorted scene cuts from the last detection, in milliseconds
+        self.snap_to_scenes = False
+
+        # Export mode: stream copy (fast, cuts on keyframes) or re-encode (frame-accurate)
+        self.reencode_enabled = False
+
+        # Keyboard shortcuts, looked up once per key press in eventFilter
+        self._key_actions = {
+            Qt.Key_Space: self.seek_next_frame,
+            Qt.Key_S: self.add_split,
+            Qt.Key_Left: self.seek_prev_frame,
+            Qt.Key_Right: self.seek_next_frame,
+            Qt.Key_Down: lambda: self.seek_relative(-10),
+            Qt.Key_Up: lambda: self.seek_relative(10),
+        }
 
         self.init_ui()
         
@@ -166,135 +739,7 @@ class VideoSplitter(QMainWindow):
         self.installEventFilter(self)
         
         # Apply dark mode stylesheet
-        self.setStyleSheet("""
-            QWidget {
-                background-color: #2b2b2b; /* Dark background */
-                color: #ffffff; /* White text */
-                font-family: "Segoe UI", sans-serif;
-            }
-            QMainWindow {
-                background-color: #2b2b2b;
-            }
-            QGroupBox {
-                background-color: #3c3c3c; /* Slightly lighter dark for groups */
-                border: 1px solid #5a5a5a;
-                border-radius: 5px;
-                margin-top: 1ex; /* Give space for the title */
-                font-size: 10pt;
-                font-weight: bold;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                subcontrol-position: top center; /* Position at top center */
-                padding: 0 3px;
-                background-color: #3c3c3c;
-                color: #87ceeb; /* Sky Blue for titles */
-            }
-            QLabel {
-                color: #ffffff;
-            }
-            QPushButton {
-                background-color: #4682b4; /* Steel Blue */
-                color: #ffffff;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 5px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #5b9bd5; /* Lighter Steel Blue on hover */
-            }
-            QPushButton:pressed {
-                background-color: #3a6d9b; /* Darker Steel Blue on pressed */
-            }
-            QPushButton:disabled {
-                background-color: #5a5a5a;
-                color: #cccccc;
-            }
-            QSlider::groove:horizontal {
-                border: 1px solid #5a5a5a;
-                height: 8px; /* the groove height */
-                background: #3c3c3c;
-                margin: 2px 0;
-                border-radius: 4px;
-            }
-            QSlider::handle:horizontal {
-                background: #87ceeb; /* Sky Blue handle */
-                border: 1px solid #87ceeb;
-                width: 18px;
-                margin: -5px 0; /* handle is 18x18 when groove is 8px */
-                border-radius: 9px;
-            }
-            QSlider::sub-page:horizontal {
-                background: #4682b4; /* Steel Blue for filled part */
-                border: 1px solid #4682b4;
-                height: 8px;
-                border-radius: 4px;
-            }
-            QListWidget {
-                background-color: #3c3c3c;
-                border: 1px solid #5a5a5a;
-                border-radius: 5px;
-                color: #ffffff;
-                alternate-background-color: #444444;
-            }
-            QListWidget::item {
-                padding: 5px;
-            }
-            QListWidget::item:selected {
-                background-color: #4682b4; /* Steel Blue for selected item */
-                color: #ffffff;
-            }
-            QProgressBar {
-                border: 1px solid #5a5a5a;
-                border-radius: 5px;
-                text-align: center;
-                background-color: #3c3c3c;
-                color: #ffffff;
-            }
-            QProgressBar::chunk {
-                background-color: #4682b4; /* Steel Blue for progress */
-                width: 20px;
-            }
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-            }
-            QCheckBox::indicator:unchecked {
-                background-color: #5a5a5a;
-                border: 1px solid #888888;
-                border-radius: 3px;
-            }
-            QCheckBox::indicator:checked {
-                background-color: #4682b4; /* Steel Blue for checked */
-                border: 1px solid #4682b4;
-                border-radius: 3px;
-                image: url(data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAcAAAAHCAYAAACzXPxXAAAAAXNSR0IArs4c6QAAADFJREFUGFcBwAEGAACjKx5OAAAAAElFTkSuQmCC); /* A tiny white checkmark if you have one */
-            }
-            QTabWidget::pane {
-                border: 1px solid #5a5a5a;
-                background-color: #3c3c3c;
-                border-radius: 5px;
-            }
-            QTabBar::tab {
-                background: #3c3c3c;
-                border: 1px solid #5a5a5a;
-                border-bottom-color: #3c3c3c; /* same as pane color */
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-                min-width: 8ex;
-                padding: 5px;
-                color: #ffffff;
-            }
-            QTabBar::tab:selected {
-                background: #4682b4; /* Steel Blue for selected tab */
-                border-color: #4682b4;
-                border-bottom-color: #4682b4; /* selected tab has same border color as pane */
-            }
-            QTabBar::tab:hover {
-                background: #5b9bd5; /* Lighter Steel Blue on hover */
-            }
-        """)
+        self.setStyleSheet(_DARK_QSS)
         
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -328,6 +773,7 @@ class VideoSplitter(QMainWindow):
         self.preview_label.setStyleSheet("border: 1px solid #5a5a5a; background-color: black;")
         self.preview_label.setAlignment(Qt.AlignCenter)
         self.preview_label.setScaledContents(True)
+        self.preview_label.installEventFilter(self) # Track resizes to re-render previews at the new size
         
         self.aspect_ratio_widget = AspectRatioWidget(self.preview_label) # Wrap label in aspect ratio widget
         preview_layout.addWidget(self.aspect_ratio_widget)
@@ -349,6 +795,12 @@ class VideoSplitter(QMainWindow):
         self.timeline_slider = QSlider(Qt.Horizontal)
         self.timeline_slider.setEnabled(False)
         self.timeline_slider.valueChanged.connect(self.on_timeline_change)
+        self.timeline_slider.sliderReleased.connect(self.on_timeline_released)
+
+        self._seek_timer = QTimer(self)
+        self._seek_timer.setSingleShot(True)
+        self._seek_timer.setInterval(80)
+        self._seek_timer.timeout.connect(self._do_pending_seek)
         timeline_layout.addWidget(self.timeline_slider)
         
         # Frame navigation
@@ -393,6 +845,12 @@ class VideoSplitter(QMainWindow):
         
         self.splits_list = QListWidget()
         self.splits_list.itemDoubleClicked.connect(self.jump_to_split)
+
+        # Scene detection can add splits in quick bursts; rebuild the list at most once per 50 ms
+        self._splits_refresh_timer = QTimer(self)
+        self._splits_refresh_timer.setSingleShot(True)
+        self._splits_refresh_timer.setInterval(50)
+        self._splits_refresh_timer.timeout.connect(self.update_splits_list)
         
         split_layout.addWidget(self.add_split_button, 0, 0)
         split_layout.addWidget(self.clear_splits_button, 0, 1)
@@ -427,7 +885,8 @@ class VideoSplitter(QMainWindow):
         self.max_segment_duration_slider.setValue(int(self.max_segment_duration * 100)) # Default 28.5 seconds
         self.max_segment_duration_slider.setEnabled(False) # Initially disabled
         self.max_segment_duration_label.setEnabled(False) # Initially disabled
-        self.max_segment_duration_slider.valueChanged.connect(self.update_max_segment_duration_label)
+        self.max_segment_duration_notifier = DelayedNotification(self.update_max_segment_duration_label, parent=self)
+        self.max_segment_duration_slider.valueChanged.connect(self.max_segment_duration_notifier.notify)
 
         max_duration_layout.addWidget(max_duration_label_prefix)
         max_duration_layout.addWidget(self.max_segment_duration_slider)
@@ -445,7 +904,8 @@ class VideoSplitter(QMainWindow):
         self.min_segment_duration_slider.setValue(int(self.min_segment_duration * 100))
         self.min_segment_duration_slider.setEnabled(False)
         self.min_segment_duration_label.setEnabled(False)
-        self.min_segment_duration_slider.valueChanged.connect(self.update_min_segment_duration_label)
+        self.min_segment_duration_notifier = DelayedNotification(self.update_min_segment_duration_label, parent=self)
+        self.min_segment_duration_slider.valueChanged.connect(self.min_segment_duration_notifier.notify)
 
         min_duration_layout.addWidget(min_duration_label_prefix)
         min_duration_layout.addWidget(self.min_segment_duration_slider)
@@ -461,6 +921,10 @@ class VideoSplitter(QMainWindow):
         self.detect_scenes_button = QPushButton("Detect Scenes (might take a while)")
         self.detect_scenes_button.clicked.connect(self.detect_scenes)
         self.detect_scenes_button.setEnabled(False) # Enable after video loaded
+        if SceneManager is None:
+            self.detect_scenes_button.setToolTip("Scene scores are kept for this session, so detecting again with another threshold is instant")
+        else:
+            self.detect_scenes_button.setToolTip("Uses PySceneDetect, which analyzes the whole video on every run")
         scene_detection_layout.addWidget(self.detect_scenes_button)
 
         threshold_layout = QHBoxLayout()
@@ -472,14 +936,36 @@ class VideoSplitter(QMainWindow):
         self.scene_threshold_slider.setMinimum(10) # 0.1
         self.scene_threshold_slider.setMaximum(100) # 1.0
         self.scene_threshold_slider.setValue(int(self.scene_detection_threshold * 100))
-        self.scene_threshold_slider.valueChanged.connect(self.update_scene_threshold_label)
+        self.scene_threshold_notifier = DelayedNotification(self.update_scene_threshold_label, parent=self)
+        self.scene_threshold_slider.valueChanged.connect(self.scene_threshold_notifier.notify)
         
         threshold_layout.addWidget(threshold_label_prefix)
         threshold_layout.addWidget(self.scene_threshold_slider)
         threshold_layout.addWidget(self.scene_threshold_label)
         scene_detection_layout.addLayout(threshold_layout)
+
+        self.snap_checkbox = QCheckBox(f"Snap new split points to the nearest detected scene (within {_SNAP_TOLERANCE_MS / 1000:.1f}s)")
+        self.snap_checkbox.setChecked(False)
+        self.snap_checkbox.stateChanged.connect(self.toggle_snap_to_scenes)
+        scene_detection_layout.addWidget(self.snap_checkbox)
+
+        self.snap_splits_button = QPushButton("Snap All Split Points to Detected Scenes")
+        self.snap_splits_button.clicked.connect(self.snap_splits_to_scenes)
+        self.snap_splits_button.setEnabled(False) # Enable once scenes have been detected
+        scene_detection_layout.addWidget(self.snap_splits_button)
         
         settings_layout.addWidget(scene_detection_group)
+
+        # Export Options controls
+        export_options_group = QGroupBox("Export Options")
+        export_options_layout = QVBoxLayout(export_options_group)
+
+        self.reencode_checkbox = QCheckBox("Re-encode for frame-accurate cuts (uses a GPU encoder when available)")
+        self.reencode_checkbox.setChecked(False)
+        self.reencode_checkbox.stateChanged.connect(self.toggle_reencode)
+        export_options_layout.addWidget(self.reencode_checkbox)
+
+        settings_layout.addWidget(export_options_group)
         settings_layout.addStretch(1)
 
         # --- Project Controls --- #
@@ -526,17 +1012,17 @@ class VideoSplitter(QMainWindow):
         self.video_path = file_path
         self.file_label.setText(os.path.basename(file_path))
         
-        # Clear existing splits when a new video is loaded
+        # Clear existing splits (and anything a running detection would still add) when a new video is loaded
+        self._cancel_scene_detection()
         self.clear_splits()
+        self._scene_cuts = []
+        self.snap_splits_button.setEnabled(False)
+        self._thumb_cache.clear()
+        self.open_decoder(file_path)
         
-        # Get video info using ffprobe
+        # Get video info using ffprobe (cached per file version)
         try:
-            cmd = [
-                'ffprobe', '-v', 'quiet', '-print_format', 'json', 
-                '-show_format', '-show_streams', file_path
-            ]
-            result = subprocess.run(cmd, capture_output=True, text=True, creationflags=subprocess.CREATE_NO_WINDOW)
-            video_info = json.loads(result.stdout)
+            video_info = self._probe(file_path)
             
             # Find video stream
             video_stream = None
@@ -546,8 +1032,11 @@ class VideoSplitter(QMainWindow):
                     break
             
             if video_stream:
-                self.video_duration = float(video_info['format']['duration'])
-                self.fps = eval(video_stream.get('r_frame_rate', '30/1'))
+                self.video_duration_ms = round(float(video_info['format']['duration']) * 1000)
+                self._duration_str = self.format_time_ms(self.video_duration_ms)
+                num, _, den = video_stream.get('r_frame_rate', '30/1').partition('/')
+                self.fps = float(Fraction(int(num), int(den or 1) or 1)) or 30 # 0/0 means unknown, keep the default
+                self._frame_dt_ms = 1000.0 / self.fps
                 self.video_width = video_stream.get('width', 0)
                 self.video_height = video_stream.get('height', 0)
                 
@@ -557,7 +1046,7 @@ class VideoSplitter(QMainWindow):
                     self.aspect_ratio_widget.aspect_ratio = 16/9 # Default to 16:9 if height is zero
 
                 # Setup timeline
-                self.timeline_slider.setMaximum(int(self.video_duration * 1000))
+                self.timeline_slider.setMaximum(self.video_duration_ms)
                 self.timeline_slider.setEnabled(True)
                 self.add_split_button.setEnabled(True)
                 
@@ -567,7 +1056,7 @@ class VideoSplitter(QMainWindow):
                 QApplication.processEvents() # Process events to ensure layout calculation
 
                 # Load first frame
-                self.seek_to_time(0)
+                self.seek_to_time_ms(0)
                 self.aspect_ratio_widget.resize(self.aspect_ratio_widget.size()) # Trigger resize for proper scaling
                 
                 # Enable save project button after successful video load
@@ -577,124 +1066,299 @@ class VideoSplitter(QMainWindow):
                 self.detect_scenes_button.setEnabled(True)
                 
             else:
-                QMessageBox.warning(self, "Error", "No video stream found in file")
+                self._show_warning("Error", "No video stream found in file")
                 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load video: {str(e)}")
     
-    def seek_to_time(self, time_seconds):
+    def _probe(self, file_path):
+        file_path = os.path.abspath(file_path)
+        return _probe_cached(_file_cache_key(file_path), file_path)
+
+    def open_decoder(self, file_path):
+        self.close_decoder()
+        if av is None:
+            return
+
+        try:
+            self.video_container = av.open(file_path)
+            self.video_stream = self.video_container.streams.video[0]
+            self.video_stream.thread_type = 'AUTO'
+        except Exception:
+            self.close_decoder() # Unsupported by PyAV, previews will use ffmpeg instead
+
+    def close_decoder(self):
+        if self.video_container is not None:
+            self.video_container.close()
+        self.video_container = None
+        self.video_stream = None
+
+    def _decode_frame(self, time_seconds):
+        # Seek the already-open container instead of spawning a process and round-tripping a JPEG
+        try:
+            stream = self.video_stream
+            target = int(time_seconds / stream.time_base) + (stream.start_time or 0)
+            self.video_container.seek(target, stream=stream)
+
+            frame = None
+            for frame in self.video_container.decode(stream):
+                if frame.pts is None or frame.pts >= target:
+                    break
+            if frame is None:
+                return None
+
+            # Scale down while converting so a 4K frame isn't converted and uploaded only for Qt to shrink it
+            width = self._get_preview_width()
+            if frame.width > width:
+                height = max(2, round(frame.height * width / frame.width / 2) * 2)
+                rgb = frame.reformat(width=width, height=height, format='rgb24')
+            else:
+                rgb = frame.reformat(format='rgb24')
+            plane = rgb.planes[0]
+            data = bytes(plane)
+            image = QImage(data, rgb.width, rgb.height, plane.line_size, QImage.Format_RGB888)
+            return QPixmap.fromImage(image)
+        except Exception:
+            return None
+
+    def _extract_frame(self, time_seconds, accurate=True):
+        # Pipe the frame through stdout as an uncompressed BMP: nothing touches the disk, and there is no
+        # JPEG encode in ffmpeg or decode in Qt, just a copy of the pixels
+        hwaccel_args = _hwaccel_args()
+        if accurate:
+            # Two-stage seek: jump to a keyframe shortly before the target, then decode forward to the exact frame
+            coarse_time = max(0.0, time_seconds - 2.0)
+            seek_args = ['-ss', str(coarse_time), '-i', self.video_path, '-ss', str(time_seconds - coarse_time)]
+        else:
+            # Keyframe-only seek, much cheaper on long GOPs but may show a frame slightly before the target
+            seek_args = ['-ss', str(time_seconds), '-noaccurate_seek', '-i', self.video_path]
+        # Scale to the preview size in ffmpeg (never up) so less data is produced, piped and loaded
+        cmd = ['ffmpeg'] + hwaccel_args + seek_args + [
+            '-vf', f"scale='min(iw,{self._get_preview_width()})':-2",
+            '-frames:v', '1', '-f', 'image2pipe', '-vcodec', 'bmp', '-'
+        ]
+        try:
+            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True, creationflags=_NO_WINDOW)
+        except subprocess.CalledProcessError:
+            if not hwaccel_args:
+                raise
+            # The hardware decoder could not handle this input, retry in software from now on
+            _disable_hwaccel()
+            return self._extract_frame(time_seconds, accurate)
+        pixmap = QPixmap()
+        pixmap.loadFromData(result.stdout, 'BMP')
+        return pixmap
+
+    def _get_preview_width(self):
+        if self._preview_width is None:
+            self._preview_width = round((self.preview_label.width() or 640) * self.preview_label.devicePixelRatioF())
+        return self._preview_width
+
+    def _on_preview_resized(self):
+        # Cached frames were rendered for the old size
+        self._preview_width = None
+        self._thumb_cache.clear()
+        # Re-render the shown frame at the new size once resizing settles, through the same debounce as slider seeks
+        if self.video_path:
+            if self._pending_seek is None:
+                self._pending_seek = self.current_time_ms
+            self._seek_timer.start()
+
+    def _get_frame(self, time_seconds, accurate=True):
+        # Quantize to a frame index so nearby slider positions share one cached preview.
+        # An exact frame can stand in for a fast one, but not the other way round.
+        frame_idx = round(time_seconds * self.fps)
+        for key in ((frame_idx, True),) if accurate else ((frame_idx, True), (frame_idx, False)):
+            pixmap = self._thumb_cache.get(key)
+            if pixmap is not None:
+                self._thumb_cache.move_to_end(key)
+                return pixmap
+
+        frame_time = frame_idx / self.fps
+        pixmap = self._decode_frame(frame_time) if self.video_container else None
+        if pixmap is None:
+            pixmap = self._extract_frame(frame_time, accurate)
+        else:
+            accurate = True # PyAV always decodes up to the exact frame
+
+        if not pixmap.isNull():
+            self._thumb_cache[(frame_idx, accurate)] = pixmap
+            if len(self._thumb_cache) > _THUMB_CACHE_SIZE:
+                self._thumb_cache.popitem(last=False)
+        return pixmap
+
+    def seek_to_time_ms(self, time_ms, accurate=True):
         if not self.video_path:
             return
             
-        self.current_time = max(0.0, min(time_seconds, self.video_duration))
-        
-        # Extract frame at current time
-        frame_path = os.path.join(self.temp_dir, "current_frame.jpg")
-        cmd = [
-            'ffmpeg', '-y', '-ss', str(self.current_time), '-i', self.video_path,
-            '-vframes', '1', '-q:v', '2', frame_path
-        ]
+        self.current_time_ms = max(0, min(round(time_ms), self.video_duration_ms))
         
         try:
-            subprocess.run(cmd, capture_output=True, check=True, creationflags=subprocess.CREATE_NO_WINDOW)
+            # Extract frame at current time
+            pixmap = self._get_frame(self.current_time_ms / 1000, accurate)
             
-            # Load and display frame
-            pixmap = QPixmap(frame_path)
+            # Display frame
             if not pixmap.isNull():
                 self.preview_label.setPixmap(pixmap)
             
             # Update time display
-            current_str = self.format_time(self.current_time)
-            total_str = self.format_time(self.video_duration)
-            self.time_label.setText(f"{current_str} / {total_str}")
+            self.time_label.setText(f"{self.format_time_ms(self.current_time_ms)} / {self._duration_str}")
             
             # Update slider (without triggering signal)
             self.timeline_slider.blockSignals(True)
-            self.timeline_slider.setValue(int(self.current_time * 1000))
+            self.timeline_slider.setValue(self.current_time_ms)
             self.timeline_slider.blockSignals(False)
             
         except subprocess.CalledProcessError:
             pass  # Failed to extract frame, continue anyway
     
     def on_timeline_change(self, value):
-        self.seek_to_time(value / 1000.0)
+        # The time label is cheap, keep it live; the frame is only fetched once the slider rests for a moment
+        self._pending_seek = value
+        self.time_label.setText(f"{self.format_time_ms(value)} / {self._duration_str}")
+        self._seek_timer.start()
+
+    def _do_pending_seek(self):
+        time_ms, self._pending_seek = self._pending_seek, None
+        if time_ms is not None:
+            # Use fast keyframe seeks only while the handle is being dragged
+            self.seek_to_time_ms(time_ms, accurate=not self.timeline_slider.isSliderDown())
+
+    def on_timeline_released(self):
+        # Settle on the exact frame once the drag ends
+        self._seek_timer.stop()
+        self._pending_seek = None
+        self.seek_to_time_ms(self.timeline_slider.value())
     
     def seek_relative(self, seconds):
-        new_time = self.current_time + seconds
-        self.seek_to_time(new_time)
+        self.seek_to_time_ms(self.current_time_ms + seconds * 1000)
     
+    def _seek_frames(self, delta):
+        # Step in whole frames so rounding to milliseconds never skips or repeats a frame
+        if self.video_path:
+            frame = round(self.current_time_ms / self._frame_dt_ms)
+            self.seek_to_time_ms((frame + delta) * self._frame_dt_ms)
+
     def seek_next_frame(self):
-        if self.video_path and self.fps > 0:
-            frame_duration = 1.0 / self.fps
-            new_time = self.current_time + frame_duration
-            self.seek_to_time(new_time)
+        self._seek_frames(1)
 
     def seek_prev_frame(self):
-        if self.video_path and self.fps > 0:
-            frame_duration = 1.0 / self.fps
-            new_time = self.current_time - frame_duration
-            self.seek_to_time(new_time)
-
-    def format_time(self, seconds):
-        total_milliseconds = int(seconds * 1000)
-        mins = total_milliseconds // 60000
-        secs = (total_milliseconds % 60000) // 1000
-        msecs = total_milliseconds % 1000
+        self._seek_frames(-1)
+
+    def format_time_ms(self, time_ms):
+        mins, rest = divmod(time_ms, 60000)
+        secs, msecs = divmod(rest, 1000)
         return f"{mins:02d}:{secs:02d}.{msecs:03d}"
     
     def add_split(self):
-        if self.current_time not in self.splits:
-            self.splits.append(self.current_time)
-            self.splits.sort()
-            self.update_splits_list()
+        self._sync_splits_list()
+        split_ms = self.current_time_ms
+        if self.snap_to_scenes:
+            cut = _nearest_sorted(self._scene_cuts, split_ms)
+            if cut is not None and abs(cut - split_ms) <= _SNAP_TOLERANCE_MS:
+                split_ms = cut
+        if split_ms not in self._splits_set:
+            # self.splits is kept sorted, so a binary search finds the insert position
+            idx = bisect_left(self.splits, split_ms)
+            self.splits.insert(idx, split_ms)
+            self._splits_set.add(split_ms)
+            self._insert_split_row(idx)
+            self._renumber_split_rows(idx + 1)
             
             if len(self.splits) >= 1:
                 self.export_button.setEnabled(True)
     
     def clear_splits(self):
         self.splits.clear()
+        self._splits_set.clear()
         self.update_splits_list()
         self.export_button.setEnabled(False)
     
+    def _split_row_text(self, index):
+        return f"Split {index+1}: {self.format_time_ms(self.splits[index])}"
+
+    def _insert_split_row(self, index, text=None):
+        # Create a widget for each item to hold label and button
+        item_widget = QWidget()
+        item_layout = QHBoxLayout(item_widget)
+        
+        label = QLabel(text if text is not None else self._split_row_text(index))
+        remove_button = QPushButton("x")
+        remove_button.setFixedSize(20, 20) # Make button small
+        
+        # One shared slot for every row; the split time travels with the button. Unlike the row index
+        # it stays correct while a list rebuild is pending.
+        split_ms = self.splits[index]
+        remove_button.setProperty('split_ms', split_ms)
+        remove_button.clicked.connect(self._on_remove_clicked)
+        
+        item_layout.addWidget(label)
+        item_layout.addStretch()
+        item_layout.addWidget(remove_button)
+        item_layout.setContentsMargins(0, 0, 0, 0) # Remove margins for compact look
+        
+        list_item = QListWidgetItem()
+        list_item.setData(Qt.UserRole, split_ms)
+        list_item.setSizeHint(item_widget.sizeHint())
+        self.splits_list.insertItem(index, list_item)
+        self.splits_list.setItemWidget(list_item, item_widget)
+        self._list_row_widgets.insert(index, item_widget)
+
+    def _renumber_split_rows(self, start):
+        # Only the labels after an insert/remove change, the row widgets themselves are reused
+        for i in range(start, len(self.splits)):
+            self._list_row_widgets[i].findChild(QLabel).setText(self._split_row_text(i))
+
+    def _split_index(self, split_ms):
+        # Position of a split time in self.splits, or -1 if it is no longer there
+        idx = bisect_left(self.splits, split_ms)
+        if idx < len(self.splits) and self.splits[idx] == split_ms:
+            return idx
+        return -1
+
+    def _on_remove_clicked(self):
+        index = self._split_index(self.sender().property('split_ms'))
+        if index >= 0:
+            self.remove_split(index)
+
+    def _sync_splits_list(self):
+        # Apply a pending rebuild now, so incremental row edits line up with self.splits
+        if self._splits_refresh_timer.isActive():
+            self.update_splits_list()
+
     def update_splits_list(self):
-        self.splits_list.clear()
-        for i, split_time in enumerate(self.splits):
-            time_str = self.format_time(split_time)
-            
-            # Create a widget for each item to hold label and button
-            item_widget = QWidget()
-            item_layout = QHBoxLayout(item_widget)
-            
-            label = QLabel(f"Split {i+1}: {time_str}")
-            remove_button = QPushButton("x")
-            remove_button.setFixedSize(20, 20) # Make button small
-            
-            # Connect button to remove_split method with the current index
-            remove_button.clicked.connect(lambda checked, index=i: self.remove_split(index))
-            
-            item_layout.addWidget(label)
-            item_layout.addStretch()
-            item_layout.addWidget(remove_button)
-            item_layout.setContentsMargins(0, 0, 0, 0) # Remove margins for compact look
-            
-            list_item = QListWidgetItem(self.splits_list)
-            list_item.setSizeHint(item_widget.sizeHint())
-            self.splits_list.addItem(list_item)
-            self.splits_list.setItemWidget(list_item, item_widget)
+        # Full rebuild, for when the whole split list has been replaced
+        self._splits_refresh_timer.stop()
+        texts = [self._split_row_text(i) for i in range(len(self.splits))]
+        # Suspend painting and signals so the rebuild costs one layout pass
+        self.splits_list.setUpdatesEnabled(False)
+        self.splits_list.blockSignals(True)
+        try:
+            self.splits_list.clear()
+            self._list_row_widgets = []
+            for i, text in enumerate(texts):
+                self._insert_split_row(i, text)
+        finally:
+            self.splits_list.blockSignals(False)
+            self.splits_list.setUpdatesEnabled(True)
     
     def remove_split(self, index):
+        self._sync_splits_list()
         if 0 <= index < len(self.splits):
-            del self.splits[index]
-            self.splits.sort() # Re-sort to maintain order if needed, though not strictly necessary after deletion
-            self.update_splits_list()
+            self._splits_set.discard(self.splits[index])
+            del self.splits[index] # Deleting keeps the list sorted
+            self.splits_list.removeItemWidget(self.splits_list.item(index))
+            self.splits_list.takeItem(index)
+            del self._list_row_widgets[index]
+            self._renumber_split_rows(index)
             # Disable export button if no splits remain
             if not self.splits:
                 self.export_button.setEnabled(False)
     
     def jump_to_split(self, item):
-        row = self.splits_list.row(item)
-        if 0 <= row < len(self.splits):
-            self.seek_to_time(self.splits[row])
+        split_ms = item.data(Qt.UserRole)
+        if split_ms is not None and self._split_index(split_ms) >= 0:
+            self.seek_to_time_ms(split_ms)
     
     def toggle_auto_split_controls(self, state):
         self.auto_split_enabled = bool(state)
@@ -703,108 +1367,192 @@ class VideoSplitter(QMainWindow):
         self.min_segment_duration_slider.setEnabled(self.auto_split_enabled)
         self.min_segment_duration_label.setEnabled(self.auto_split_enabled)
     
+    def toggle_reencode(self, state):
+        self.reencode_enabled = bool(state)
+
     def update_max_segment_duration_label(self, value):
-        self.max_segment_duration = value / 100.0
-        self.max_segment_duration_label.setText(f"{self.max_segment_duration:.1f}")
-        # Ensure max is not less than min
-        if self.max_segment_duration < self.min_segment_duration:
-            self.min_segment_duration = self.max_segment_duration
-            self.min_segment_duration_slider.setValue(int(self.min_segment_duration * 100))
+        self.max_segment_duration = max_duration = value / 100.0
+        self.max_segment_duration_label.setText("%.1f" % max_duration)
+        # Ensure max is not less than min (signals blocked so the min slot doesn't bounce back into this one)
+        if max_duration < self.min_segment_duration:
+            self.min_segment_duration = max_duration
+            slider = self.min_segment_duration_slider
+            slider.blockSignals(True)
+            slider.setValue(value) # Both sliders share the same scale, no float round trip needed
+            slider.blockSignals(False)
+            self.min_segment_duration_label.setText("%.1f" % max_duration)
 
     def update_min_segment_duration_label(self, value):
-        self.min_segment_duration = value / 100.0
-        self.min_segment_duration_label.setText(f"{self.min_segment_duration:.1f}")
-        # Ensure min is not greater than max
-        if self.min_segment_duration > self.max_segment_duration:
-            self.max_segment_duration = self.min_segment_duration
-            self.max_segment_duration_slider.setValue(int(self.max_segment_duration * 100))
+        self.min_segment_duration = min_duration = value / 100.0
+        self.min_segment_duration_label.setText("%.1f" % min_duration)
+        # Ensure min is not greater than max (signals blocked so the max slot doesn't bounce back into this one)
+        if min_duration > self.max_segment_duration:
+            self.max_segment_duration = min_duration
+            slider = self.max_segment_duration_slider
+            slider.blockSignals(True)
+            slider.setValue(value)
+            slider.blockSignals(False)
+            self.max_segment_duration_label.setText("%.1f" % min_duration)
 
     def update_scene_threshold_label(self, value):
-        self.scene_detection_threshold = value / 100.0
-        self.scene_threshold_label.setText(f"{self.scene_detection_threshold:.1f}")
+        self.scene_detection_threshold = threshold = value / 100.0
+        self.scene_threshold_label.setText("%.1f" % threshold)
 
     def detect_scenes(self):
         if not self.video_path:
-            QMessageBox.warning(self, "Warning", "No video loaded to detect scenes.")
+            self._show_warning("Warning", "No video loaded to detect scenes.")
             return
         
+        self._cancel_scene_detection()
         self.detect_scenes_button.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0) # Scene detection doesn't have granular progress, so reset
         self.progress_bar.setFormat("Detecting scenes...")
 
-        if self.scene_detector and self.scene_detector.isRunning():
-            self.scene_detector.terminate()
-            self.scene_detector.wait()
-
-        self.scene_detector = SceneDetector(self.video_path, self.scene_detection_threshold)
-        self.scene_detector.scene_detected.connect(self.add_split_from_detection)
-        self.scene_detector.finished.connect(self.on_scene_detection_finished)
-        self.scene_detector.error.connect(self.on_scene_detection_error)
-        self.scene_detector.start()
-
-    def add_split_from_detection(self, time_seconds):
-        # Add detected scene change as a split point, avoiding duplicates
-        if time_seconds not in self.splits:
-            self.splits.append(time_seconds)
-            self.splits.sort()
-            self.update_splits_list()
+        self._scene_cuts = []
+        self.snap_splits_button.setEnabled(False)
+
+        self.scene_detector = SceneDetector(self.video_path, self.scene_detection_threshold, self._scene_stats_path())
+        self.scene_detector.signals.scenes_detected.connect(self.add_splits_from_detection)
+        self.scene_detector.signals.finished.connect(self.on_scene_detection_finished)
+        self.scene_detector.signals.error.connect(self.on_scene_detection_error)
+        QThreadPool.globalInstance().start(self.scene_detector)
+
+    def _cancel_scene_detection(self):
+        # Stop a running detection and drop whatever it already queued for the GUI thread
+        detector, self.scene_detector = self.scene_detector, None
+        if detector is None:
+            return
+        detector.cancel()
+        detector.signals.scenes_detected.disconnect()
+        detector.signals.finished.disconnect()
+        detector.signals.error.disconnect()
+        self.progress_bar.setVisible(False)
+        self.progress_bar.setFormat("%p%") # Reset format
+
+    def _is_current_detection(self):
+        # Batches already posted before a cancel can still be delivered; only accept the running detector's
+        return self.scene_detector is not None and self.sender() is self.scene_detector.signals
+
+    def _scene_stats_path(self):
+        try:
+            key = _file_cache_key(self.video_path)
+        except OSError:
+            return None
+        return os.path.join(self.temp_dir, f"{key}.stats.csv")
+
+    def add_splits_from_detection(self, times):
+        # Add detected scene changes as split points, avoiding duplicates
+        if not self._is_current_detection():
+            return
+        added = False
+        for time_seconds in times:
+            time_ms = round(time_seconds * 1000)
+            idx = bisect_left(self._scene_cuts, time_ms)
+            if idx == len(self._scene_cuts) or self._scene_cuts[idx] != time_ms:
+                self._scene_cuts.insert(idx, time_ms)
+            if time_ms not in self._splits_set:
+                self.splits.insert(bisect_left(self.splits, time_ms), time_ms)
+                self._splits_set.add(time_ms)
+                added = True
+
+        if added:
+            if not self._splits_refresh_timer.isActive():
+                self._splits_refresh_timer.start()
             # Enable export button if at least one split is added via detection
-            if len(self.splits) >= 1:
-                self.export_button.setEnabled(True)
+            self.export_button.setEnabled(True)
 
     def on_scene_detection_finished(self):
+        if not self._is_current_detection():
+            return
+        self.scene_detector = None
+        self._sync_splits_list()
+        self.snap_splits_button.setEnabled(bool(self._scene_cuts))
         self.progress_bar.setVisible(False)
         self.progress_bar.setFormat("%p%") # Reset format
         self.detect_scenes_button.setEnabled(True)
         QMessageBox.information(self, "Scene Detection", "Scene detection completed.")
     
     def on_scene_detection_error(self, error_message):
+        if not self._is_current_detection():
+            return
+        self.scene_detector = None
         self.progress_bar.setVisible(False)
         self.progress_bar.setFormat("%p%") # Reset format
         self.detect_scenes_button.setEnabled(True)
         QMessageBox.critical(self, "Scene Detection Error", error_message)
 
+    def toggle_snap_to_scenes(self, state):
+        self.snap_to_scenes = bool(state)
+
+    def snap_splits_to_scenes(self):
+        # Move every split point that is within tolerance of a detected cut onto that cut
+        if not self._scene_cuts or not self.splits:
+            return
+        self._sync_splits_list()
+        if np is not None:
+            cuts = np.asarray(self._scene_cuts, dtype=np.int64)
+            splits = np.asarray(self.splits, dtype=np.int64)
+            # Both lists are sorted, so the nearest cut is one of the two around each insertion point
+            idx = np.searchsorted(cuts, splits)
+            before = cuts[np.clip(idx - 1, 0, len(cuts) - 1)]
+            after = cuts[np.clip(idx, 0, len(cuts) - 1)]
+            nearest = np.where(np.abs(splits - before) <= np.abs(after - splits), before, after)
+            snapped = np.where(np.abs(nearest - splits) <= _SNAP_TOLERANCE_MS, nearest, splits)
+            new_splits = np.unique(snapped).tolist()
+        else:
+            new_splits = []
+            for split_ms in self.splits:
+                cut = _nearest_sorted(self._scene_cuts, split_ms)
+                new_splits.append(cut if abs(cut - split_ms) <= _SNAP_TOLERANCE_MS else split_ms)
+            new_splits = sorted(set(new_splits)) # Two splits can snap onto the same cut
+
+        if new_splits != self.splits:
+            self.splits = new_splits
+            self._splits_set = set(new_splits)
+            self.update_splits_list()
+
+    def _show_warning(self, title, text):
+        # Same as QMessageBox.warning, but the dialog is built once and reused
+        if self._warn_box is None:
+            self._warn_box = QMessageBox(QMessageBox.Warning, title, text, QMessageBox.Ok, self)
+        else:
+            self._warn_box.setWindowTitle(title)
+            self._warn_box.setText(text)
+        self._warn_box.exec_()
+
     def _apply_auto_split(self, segments, max_duration, min_duration):
         if max_duration <= 0 or min_duration <= 0 or min_duration > max_duration:
-            QMessageBox.warning(self, "Warning", "Invalid auto-split duration settings. Please ensure Min Duration > 0, Max Duration > 0, and Min Duration <= Max Duration.")
+            self._show_warning("Warning", "Invalid auto-split duration settings. Please ensure Min Duration > 0, Max Duration > 0, and Min Duration <= Max Duration.")
+            return segments
+
+        # Common case: nothing is over the limit, so there is nothing to split
+        if max((end - start for start, end in segments), default=0) <= max_duration:
             return segments
 
+        if np is not None:
+            new_segments, unsplittable = self._auto_split_numpy(segments, max_duration, min_duration)
+        else:
+            new_segments, unsplittable = self._auto_split_python(segments, max_duration, min_duration)
+
+        if unsplittable:
+            self._show_warning("Warning", f"Could not find an ideal auto-split for {unsplittable} segment(s). Splitting by max duration.")
+        return new_segments
+
+    def _auto_split_python(self, segments, max_duration, min_duration):
         new_segments = []
+        unsplittable = 0
         for start, end in segments:
             duration = end - start
             if duration <= max_duration:
                 new_segments.append((start, end))
                 continue
 
-            # If duration > max_duration, we need to split
-            # Calculate initial number of splits based on max_duration
-            num_splits_candidate = int(duration / max_duration)
-            remainder_duration = duration % max_duration
-
-            optimal_num_segments = -1
-            if remainder_duration == 0: # Perfectly divisible
-                optimal_num_segments = num_splits_candidate
-            elif remainder_duration >= min_duration: # Last segment is valid
-                optimal_num_segments = num_splits_candidate + 1
-            else: # Last segment is too short, need to re-distribute
-                # Find the smallest number of segments 'n' such that duration/n is within [min_duration, max_duration]
-                # Iterate from num_splits_candidate upwards to ensure max_duration is respected as much as possible
-                found_optimal = False
-                for n in range(num_splits_candidate, int(duration / min_duration) + 2): # Add +2 for safety margin
-                    if n == 0: continue
-                    avg_segment_duration = duration / n
-                    if min_duration <= avg_segment_duration <= max_duration:
-                        optimal_num_segments = n
-                        found_optimal = True
-                        break
-                
-                if not found_optimal: # Fallback if no ideal split found (should not happen with valid min/max)
-                    # This fallback should ideally maintain validity, prioritizing max_duration
-                    # if min_duration constraint can't be met, user should be warned.
-                    # For now, it will simply take the current num_splits_candidate and add 1 if there's a remainder.
-                    QMessageBox.warning(self, "Warning", f"Could not find an ideal auto-split for a segment. Splitting by max duration.")
-                    optimal_num_segments = num_splits_candidate + (1 if remainder_duration > 0 else 0)
+            # If duration > max_duration, we need to split. Any n in [ceil(duration/max), floor(duration/min)]
+            # gives equal parts within both limits; the smallest keeps parts closest to max_duration.
+            optimal_num_segments = math.ceil(duration / max_duration)
+            if optimal_num_segments > math.floor(duration / min_duration):
+                unsplittable += 1 # No n satisfies min_duration too, so max_duration wins
 
             segment_length = duration / optimal_num_segments
             current_segment_start = start
@@ -815,11 +1563,34 @@ class VideoSplitter(QMainWindow):
                 new_segments.append((split_start, split_end))
                 current_segment_start = split_end
 
-        return new_segments
+        return new_segments, unsplittable
+
+    def _auto_split_numpy(self, segments, max_duration, min_duration):
+        # Same rule as _auto_split_python, computed for all segments at once
+        starts = np.asarray([start for start, _ in segments], dtype=np.float64)
+        ends = np.asarray([end for _, end in segments], dtype=np.float64)
+        durations = ends - starts
+
+        counts = np.maximum(1, np.ceil(durations / max_duration)).astype(np.int64)
+        unsplittable = int(np.count_nonzero((durations > max_duration) & (counts > np.floor(durations / min_duration))))
+        lengths = durations / counts
+
+        # Position of every output part within its source segment
+        first_part = np.cumsum(counts) - counts
+        part_index = np.arange(counts.sum()) - np.repeat(first_part, counts)
+        new_starts = np.repeat(starts, counts) + part_index * np.repeat(lengths, counts)
+
+        # Each part ends where the next one starts (keeps them exactly contiguous), and the last part
+        # of each segment ends exactly on the original end
+        new_ends = np.empty_like(new_starts)
+        new_ends[:-1] = new_starts[1:]
+        new_ends[first_part + counts - 1] = ends
+
+        return list(zip(new_starts.tolist(), new_ends.tolist())), unsplittable
 
     def export_segments(self):
         if not self.splits:
-            QMessageBox.warning(self, "Warning", "No split points defined")
+            self._show_warning("Warning", "No split points defined")
             return
         
         output_dir = QFileDialog.getExistingDirectory(self, "Select Output Directory")
@@ -827,17 +1598,12 @@ class VideoSplitter(QMainWindow):
             return
         
         # Create segments list
-        segments = []
-        split_points = [0] + self.splits + [self.video_duration]
-        
-        for i in range(len(split_points) - 1):
-            start = split_points[i]
-            end = split_points[i + 1]
-            if end > start:  # Only add valid segments
-                segments.append((start, end))
+        split_points = chain((0,), self.splits, (self.video_duration_ms,))
+        segments = [(start / 1000, end / 1000) for start, end in pairwise(split_points)
+                    if end > start]  # Only add valid segments
         
         if not segments:
-            QMessageBox.warning(self, "Warning", "No valid segments to export")
+            self._show_warning("Warning", "No valid segments to export")
             return
 
         if self.auto_split_enabled:
@@ -846,7 +1612,7 @@ class VideoSplitter(QMainWindow):
             
             # Validate min/max duration before applying auto-split
             if max_duration <= 0 or min_duration <= 0 or min_duration > max_duration:
-                QMessageBox.warning(self, "Warning", "Invalid auto-split duration settings. Please ensure Min Duration > 0, Max Duration > 0, and Min Duration <= Max Duration.")
+                self._show_warning("Warning", "Invalid auto-split duration settings. Please ensure Min Duration > 0, Max Duration > 0, and Min Duration <= Max Duration.")
                 return # Stop export if settings are invalid
 
             segments = self._apply_auto_split(segments, max_duration, min_duration)
@@ -856,7 +1622,8 @@ class VideoSplitter(QMainWindow):
         self.progress_bar.setValue(0)
         self.export_button.setEnabled(False)
         
-        self.processor = VideoProcessor(self.video_path, segments, output_dir)
+        codec = _pick_encoder() if self.reencode_enabled else 'copy'
+        self.processor = VideoProcessor(self.video_path, segments, output_dir, codec)
         self.processor.progress.connect(self.progress_bar.setValue)
         self.processor.finished.connect(self.on_export_finished)
         self.processor.error.connect(self.on_export_error)
@@ -874,7 +1641,7 @@ class VideoSplitter(QMainWindow):
     
     def save_project(self):
         if not self.video_path:
-            QMessageBox.warning(self, "Warning", "No video loaded to save project.")
+            self._show_warning("Warning", "No video loaded to save project.")
             return
 
         file_path, _ = QFileDialog.getSaveFileName(self, "Save Project File", "", "Video Splitter Project (*.vsproj);;All Files (*)")
@@ -883,16 +1650,22 @@ class VideoSplitter(QMainWindow):
 
         project_data = {
             "video_path": self.video_path,
-            "splits": self.splits,
+            "splits": [split / 1000 for split in self.splits], # Stored in seconds
             "auto_split_enabled": self.auto_split_enabled,
             "max_segment_duration": self.max_segment_duration,
             "min_segment_duration": self.min_segment_duration,
-            "scene_detection_threshold": self.scene_detection_threshold
+            "scene_detection_threshold": self.scene_detection_threshold,
+            "reencode_enabled": self.reencode_enabled
         }
 
         try:
-            with open(file_path, 'w') as f:
-                json.dump(project_data, f, indent=4)
+            if orjson is not None:
+                data = orjson.dumps(project_data, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(project_data, indent=4).encode('utf-8')
+            # Serialize first, then write the whole file in one call
+            with open(file_path, 'wb') as f:
+                f.write(data)
             QMessageBox.information(self, "Save Project", "Project saved successfully!")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save project: {str(e)}")
@@ -903,18 +1676,14 @@ class VideoSplitter(QMainWindow):
             return
 
         try:
-            with open(file_path, 'r') as f:
-                project_data = json.load(f)
+            with open(file_path, 'rb') as f:
+                data = f.read()
+            project_data = orjson.loads(data) if orjson is not None else json.loads(data)
 
             video_path = project_data.get("video_path")
-            splits = project_data.get("splits", [])
-            auto_split_enabled = project_data.get("auto_split_enabled", False)
-            max_segment_duration = project_data.get("max_segment_duration", 28.5)
-            min_segment_duration = project_data.get("min_segment_duration", 9.9)
-            scene_detection_threshold = project_data.get("scene_detection_threshold", 0.4)
 
             if not video_path or not os.path.exists(video_path):
-                QMessageBox.warning(self, "Load Project", f"Video file not found: {video_path}. Please re-select the video.")
+                self._show_warning("Load Project", f"Video file not found: {video_path}. Please re-select the video.")
                 # We can still load other settings even if video is missing
                 self.video_path = None
                 self.file_label.setText("No file selected")
@@ -926,9 +1695,32 @@ class VideoSplitter(QMainWindow):
                 self.save_project_button.setEnabled(False)
             else:
                 self.load_video(video_path) # This will reset splits, so we need to re-add them after
-                QApplication.processEvents() # Ensure video load is processed before adding splits
 
-            self.splits = sorted([float(s) for s in splits]) # Ensure splits are floats and sorted
+            # Restore splits and settings once the video load has been processed, instead of pumping the event loop here
+            QTimer.singleShot(0, lambda: self._apply_loaded_project(project_data))
+
+        except json.JSONDecodeError: # orjson.JSONDecodeError is a subclass of this
+            QMessageBox.critical(self, "Error", "Invalid project file format.")
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load project: {str(e)}")
+
+    def _apply_loaded_project(self, project_data):
+        try:
+            splits = project_data.get("splits", [])
+            auto_split_enabled = project_data.get("auto_split_enabled", False)
+            max_segment_duration = project_data.get("max_segment_duration", 28.5)
+            min_segment_duration = project_data.get("min_segment_duration", 9.9)
+            scene_detection_threshold = project_data.get("scene_detection_threshold", 0.4)
+            reencode_enabled = project_data.get("reencode_enabled", False)
+
+            # Stored in seconds, kept as sorted unique milliseconds. Files saved by this app are already
+            # in that order, so one comparison pass replaces the dedupe and sort.
+            converted = [round(float(s) * 1000) for s in splits]
+            if all(a < b for a, b in pairwise(converted)):
+                self.splits = converted
+            else:
+                self.splits = sorted(set(converted))
+            self._splits_set = set(self.splits)
             self.update_splits_list()
             if self.splits:
                 self.export_button.setEnabled(True)
@@ -945,58 +1737,71 @@ class VideoSplitter(QMainWindow):
             self.scene_threshold_slider.setValue(int(scene_detection_threshold * 100))
             self.update_scene_threshold_label(int(scene_detection_threshold * 100)) # Force update label
 
+            self.reencode_checkbox.setChecked(reencode_enabled)
+
             QMessageBox.information(self, "Load Project", "Project loaded successfully!")
 
-        except json.JSONDecodeError:
-            QMessageBox.critical(self, "Error", "Invalid project file format.")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to load project: {str(e)}")
     
     def eventFilter(self, obj, event):
-        if event.type() == QEvent.KeyPress:
-            key = event.key()
-            if key == Qt.Key_Space:
-                self.seek_to_time(self.current_time + (1.0 / self.fps))
-                return True
-            elif key == Qt.Key_S:
-                self.add_split()
-                return True
-            elif key == Qt.Key_Left:
-                self.seek_prev_frame()
-                return True
-            elif key == Qt.Key_Right:
-                self.seek_next_frame()
-                return True
-            elif key == Qt.Key_Down:
-                self.seek_relative(-10)
-                return True
-            elif key == Qt.Key_Up:
-                self.seek_relative(10)
+        if event.type() == QEvent.Resize and obj is not self:
+            # The only other object this window filters is the preview label
+            self._on_preview_resized()
+        elif event.type() == QEvent.KeyPress:
+            action = self._key_actions.get(event.key())
+            if action is not None:
+                action()
                 return True
         return super().eventFilter(obj, event)
 
     def closeEvent(self, event):
+        self._cancel_scene_detection()
+        self.close_decoder()
         # Cleanup temp directory
-        try:
-            import shutil
-            shutil.rmtree(self.temp_dir, ignore_errors=True)
-        except:
-            pass
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
         event.accept()
 
+def _ffmpeg_available():
+    # A PATH lookup avoids spawning a process in the common case
+    if shutil.which('ffmpeg') is not None:
+        return True
+    try:
+        subprocess.run(['ffmpeg', '-hide_banner', '-loglevel', 'quiet', '-version'],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                       check=True, timeout=2, creationflags=_NO_WINDOW)
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+        return False
+
+class FFmpegCheckSignals(QObject):
+    missing = pyqtSignal()
+
+class FFmpegCheck(QRunnable):
+    # Startup check, run on the thread pool so the window does not wait for it
+    def __init__(self):
+        super().__init__()
+        self.signals = FFmpegCheckSignals()
+
+    def run(self):
+        if not _ffmpeg_available():
+            self.signals.missing.emit()
+
 def main():
     app = QApplication(sys.argv)
     
-    # Check if ffmpeg is available
-    try:
-        subprocess.run(['ffmpeg', '-version'], capture_output=True, check=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        QMessageBox.critical(None, "Error", 
-                           "FFmpeg not found. Please install FFmpeg and ensure it's in your PATH.")
-        sys.exit(1)
-    
     window = VideoSplitter()
     window.show()
+
+    def on_ffmpeg_missing():
+        QMessageBox.critical(window, "Error", 
+                           "FFmpeg not found. Please install FFmpeg and ensure it's in your PATH.")
+        app.exit(1)
+
+    # Check if ffmpeg is available once the window is up
+    ffmpeg_check = FFmpegCheck()
+    ffmpeg_check.signals.missing.connect(on_ffmpeg_missing)
+    QThreadPool.globalInstance().start(ffmpeg_check)
     
     sys.exit(app.exec_())
 